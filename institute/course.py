@@ -34,6 +34,14 @@ class Course(UniversityEntity):
         for faculty in faculties:
             self.add_faculty(faculty)
 
+    def replace_faculties(self, faculties: Iterable[Faculty]) -> List[Faculty]:
+        """Swap in a new list of faculties and return the previous one."""
+        updated = list(faculties)
+        if len({faculty.name for faculty in updated}) != len(updated):
+            raise ValueError(f"Duplicate faculty names in course {self.number}.")
+        previous, self._faculties = self._faculties, updated
+        return previous
+
     def remove_faculty(self, name: str) -> None:
         for idx, faculty in enumerate(self._faculties):
             if faculty.name == name:
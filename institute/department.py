@@ -27,6 +27,14 @@ class Department(UniversityEntity):
         for group in groups:
             self.add_group(group)
 
+    def replace_groups(self, groups: Iterable[Group]) -> List[Group]:
+        """Swap in a new list of groups and return the previous one."""
+        updated = list(groups)
+        if len({group.name for group in updated}) != len(updated):
+            raise ValueError(f"Duplicate group names in department {self.name}.")
+        previous, self._groups = self._groups, updated
+        return previous
+
     def remove_group(self, name: str) -> None:
         for idx, group in enumerate(self._groups):
             if group.name == name:
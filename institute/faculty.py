@@ -27,6 +27,14 @@ class Faculty(UniversityEntity):
         for department in departments:
             self.add_department(department)
 
+    def replace_departments(self, departments: Iterable[Department]) -> List[Department]:
+        """Swap in a new list of departments and return the previous one."""
+        updated = list(departments)
+        if len({department.name for department in updated}) != len(updated):
+            raise ValueError(f"Duplicate department names in faculty {self.name}.")
+        previous, self._departments = self._departments, updated
+        return previous
+
     def remove_department(self, name: str) -> None:
         for idx, department in enumerate(self._departments):
             if department.name == name:
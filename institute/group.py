@@ -29,6 +29,14 @@ class Group(UniversityEntity):
         for student in students:
             self.add_student(student)
 
+    def replace_students(self, students: Iterable[Student]) -> List[Student]:
+        """Swap in a new list of students and return the previous one."""
+        updated = list(students)
+        if len({student.student_id for student in updated}) != len(updated):
+            raise ValueError(f"Duplicate student IDs in group {self.name}.")
+        previous, self._students = self._students, updated
+        return previous
+
     def remove_student(self, student_id: str) -> None:
         """Remove a student by ID."""
         for idx, student in enumerate(self._students):
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Callable, Iterable, List
 
 from institute.course import Course
+from institute.transaction import InstituteTransaction
 from institute.university_entity import UniversityEntity
 
 
@@ -27,6 +28,14 @@ class Institute(UniversityEntity):
         for course in courses:
             self.add_course(course)
 
+    def replace_courses(self, courses: Iterable[Course]) -> List[Course]:
+        """Swap in a new list of courses and return the previous one."""
+        updated = list(courses)
+        if len({course.number for course in updated}) != len(updated):
+            raise ValueError("Duplicate course numbers in the institute.")
+        previous, self._courses = self._courses, updated
+        return previous
+
     def remove_course(self, number: int) -> None:
         for idx, course in enumerate(self._courses):
             if course.number == number:
@@ -37,6 +46,14 @@ class Institute(UniversityEntity):
     def find_course(self, number: int) -> Course | None:
         return next((course for course in self._courses if course.number == number), None)
 
+    def transaction(self, on_commit: Callable[[Institute], None] | None = None) -> InstituteTransaction:
+        """Start a batch of mutations that is validated and applied atomically.
+
+        ``on_commit`` is called once per successful commit, e.g. to persist the
+        institute; if it raises, the batch is rolled back.
+        """
+        return InstituteTransaction(self, on_commit=on_commit)
+
     def to_dict(self) -> dict[str, object]:
         return {
             "name": self.name,
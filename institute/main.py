@@ -86,6 +86,22 @@ def choose_group(department: Department) -> Group | None:
     return group
 
 
+def choose_group_path(institute: Institute) -> tuple[int, str, str, str] | None:
+    course = choose_course(institute)
+    if not course:
+        return None
+    faculty = choose_faculty(course)
+    if not faculty:
+        return None
+    department = choose_department(faculty)
+    if not department:
+        return None
+    group = choose_group(department)
+    if not group:
+        return None
+    return course.number, faculty.name, department.name, group.name
+
+
 def add_course_flow(institute: Institute) -> None:
     name = input("Course name: ").strip() or "Unnamed Course"
     number = get_int("Course number (1-6): ")
@@ -248,6 +264,34 @@ def remove_student_flow(institute: Institute) -> None:
         print(exc)
 
 
+def move_student_flow(institute: Institute) -> None:
+    print("Source group:")
+    source = choose_group_path(institute)
+    if not source:
+        return
+    student_id = input("Student ID to move: ").strip()
+    print("Target group:")
+    target = choose_group_path(institute)
+    if not target:
+        return
+    try:
+        with institute.transaction() as transaction:
+            transaction.move_student(source, student_id, target)
+        print("Student moved.")
+    except ValueError as exc:
+        print(f"Failed to move student: {exc}")
+
+
+def promote_course_flow(institute: Institute) -> None:
+    number = get_int("Course number to promote: ")
+    try:
+        with institute.transaction() as transaction:
+            transaction.promote_course(number)
+        print(f"Course {number} promoted to course {number + 1}.")
+    except ValueError as exc:
+        print(f"Failed to promote course: {exc}")
+
+
 def show_institute_info(institute: Institute) -> None:
     print("\n=== Institute Overview ===")
     print(institute)
@@ -267,6 +311,8 @@ MENU_ACTIONS: dict[str, tuple[str, Callable[[Institute], None]]] = {
     "10": ("Add student to group", add_student_flow),
     "11": ("Remove student from group", remove_student_flow),
     "12": ("Save data", save_institute),
+    "13": ("Move student to another group", move_student_flow),
+    "14": ("Promote course to the next year", promote_course_flow),
 }
 
 
@@ -0,0 +1,363 @@
+"""Transactional batch mutations for an institute."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Set, Tuple
+
+from institute.course import Course
+from institute.department import Department
+from institute.faculty import Faculty
+from institute.group import Group
+from institute.student import Student
+from institute.university_entity import UniversityEntity
+
+if TYPE_CHECKING:
+    from institute.institute import Institute
+
+FacultyPath = Tuple[int, str]
+DepartmentPath = Tuple[int, str, str]
+GroupPath = Tuple[int, str, str, str]
+
+
+def _name_key(name: str) -> str:
+    return str(name).strip().title()
+
+
+def _student_key(student_id: str) -> str:
+    return str(student_id).strip()
+
+
+def _normalize_path(path: tuple, length: int) -> tuple:
+    if not isinstance(path, tuple) or len(path) != length:
+        raise TypeError(f"Expected a path of {length} parts, got {path!r}.")
+    return (int(path[0]),) + tuple(_name_key(name) for name in path[1:])
+
+
+def _describe(path: tuple) -> str:
+    if not path:
+        return "the institute"
+    if len(path) == 1:
+        return f"course {path[0]}"
+    if len(path) == 2:
+        return f"faculty {path[1]}"
+    if len(path) == 3:
+        return f"department {path[2]}"
+    return f"group {path[3]}"
+
+
+@dataclass
+class _StagedChildren:
+    """Children of one container as seen by a commit in progress."""
+
+    original: tuple
+    child_type: type
+    label: str
+    key: Callable[[object], Hashable]
+    replace: Callable[[List[object]], List[object]]
+    children: Dict[Hashable, object] = field(default_factory=dict)
+    changed: bool = False
+
+
+def _stage_children(container: object) -> _StagedChildren:
+    if isinstance(container, Group):
+        return _StagedChildren(
+            container.students,
+            Student,
+            "Student with ID {}",
+            lambda student: student.student_id,
+            container.replace_students,
+        )
+    if isinstance(container, Department):
+        return _StagedChildren(container.groups, Group, "Group {}", lambda group: group.name, container.replace_groups)
+    if isinstance(container, Faculty):
+        return _StagedChildren(
+            container.departments,
+            Department,
+            "Department {}",
+            lambda department: department.name,
+            container.replace_departments,
+        )
+    if isinstance(container, Course):
+        return _StagedChildren(
+            container.faculties, Faculty, "Faculty {}", lambda faculty: faculty.name, container.replace_faculties
+        )
+    return _StagedChildren(
+        container.courses, Course, "Course number {}", lambda course: course.number, container.replace_courses
+    )
+
+
+class InstituteTransaction:
+    """Queue of institute mutations validated and applied together on commit.
+
+    Operations are only recorded until :meth:`commit`. Committing replays them
+    against a name index of the affected containers, reports every conflict in
+    a single ``ValueError`` and only then touches the institute. If the
+    ``on_commit`` callback fails, all changes are rolled back.
+    """
+
+    def __init__(
+        self,
+        institute: Institute,
+        on_commit: Callable[[Institute], None] | None = None,
+    ) -> None:
+        self._institute = institute
+        self._on_commit = on_commit
+        self._operations: List[Callable[[], None]] = []
+        self._reset_staging()
+
+    def __enter__(self) -> "InstituteTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add_course(self, course: Course) -> None:
+        self._queue(self._stage_add, (), course)
+
+    def remove_course(self, number: int) -> None:
+        self._queue(self._stage_remove, (), int(number))
+
+    def add_faculty(self, course_number: int, faculty: Faculty) -> None:
+        self._queue(self._stage_add, _normalize_path((course_number,), 1), faculty)
+
+    def remove_faculty(self, course_number: int, name: str) -> None:
+        self._queue(self._stage_remove, _normalize_path((course_number,), 1), _name_key(name))
+
+    def rename_faculty(self, course_number: int, name: str, new_name: str) -> None:
+        self._queue(self._stage_rename, _normalize_path((course_number,), 1), _name_key(name), new_name)
+
+    def add_department(self, faculty: FacultyPath, department: Department) -> None:
+        self._queue(self._stage_add, _normalize_path(faculty, 2), department)
+
+    def remove_department(self, faculty: FacultyPath, name: str) -> None:
+        self._queue(self._stage_remove, _normalize_path(faculty, 2), _name_key(name))
+
+    def rename_department(self, faculty: FacultyPath, name: str, new_name: str) -> None:
+        self._queue(self._stage_rename, _normalize_path(faculty, 2), _name_key(name), new_name)
+
+    def add_group(self, department: DepartmentPath, group: Group) -> None:
+        self._queue(self._stage_add, _normalize_path(department, 3), group)
+
+    def remove_group(self, department: DepartmentPath, name: str) -> None:
+        self._queue(self._stage_remove, _normalize_path(department, 3), _name_key(name))
+
+    def rename_group(self, department: DepartmentPath, name: str, new_name: str) -> None:
+        self._queue(self._stage_rename, _normalize_path(department, 3), _name_key(name), new_name)
+
+    def add_student(self, group: GroupPath, student: Student) -> None:
+        self._queue(self._stage_add, _normalize_path(group, 4), student)
+
+    def remove_student(self, group: GroupPath, student_id: str) -> None:
+        self._queue(self._stage_remove, _normalize_path(group, 4), _student_key(student_id))
+
+    def move_group(self, source: DepartmentPath, name: str, target: DepartmentPath) -> None:
+        self._queue(self._stage_move, _normalize_path(source, 3), _name_key(name), _normalize_path(target, 3), Group)
+
+    def move_student(self, source: GroupPath, student_id: str, target: GroupPath) -> None:
+        self._queue(
+            self._stage_move, _normalize_path(source, 4), _student_key(student_id), _normalize_path(target, 4), Student
+        )
+
+    def promote_course(self, number: int) -> None:
+        """Move every faculty of course ``number`` into the next course.
+
+        Faculties and departments that already exist in the next course are
+        merged by name, groups are relinked as-is and a group name present in
+        both courses is reported as a conflict. The next course is created if
+        missing. A course that already received a promotion in the same
+        transaction cannot be promoted again, so a full rollover has to be
+        queued from the highest course down.
+        """
+        self._queue(self._stage_promote, int(number))
+
+    def discard(self) -> None:
+        """Drop every queued operation without touching the institute."""
+        self._operations.clear()
+
+    def commit(self) -> None:
+        """Validate and apply all queued operations atomically."""
+        if not self._operations:
+            return
+        operations, self._operations = self._operations, []
+        try:
+            for stage in operations:
+                stage()
+            if self._errors:
+                details = "\n".join(f"- {error}" for error in self._errors)
+                raise ValueError(f"Transaction rejected:\n{details}")
+            self._apply()
+        finally:
+            self._reset_staging()
+
+    def _queue(self, stage: Callable[..., None], *args: object) -> None:
+        self._operations.append(lambda: stage(*args))
+
+    def _reset_staging(self) -> None:
+        self._index: Dict[int, _StagedChildren] = {}
+        self._renames: List[Tuple[UniversityEntity, str]] = []
+        self._promoted_into: Set[int] = set()
+        self._errors: List[str] = []
+
+    def _staged(self, container: object, path: tuple) -> _StagedChildren:
+        staged = self._index.get(id(container))
+        if staged is None:
+            staged = self._index[id(container)] = _stage_children(container)
+            for child in staged.original:
+                key = staged.key(child)
+                if key in staged.children:
+                    self._errors.append(f"{staged.label.format(key)} appears more than once in {_describe(path)}.")
+                    continue
+                staged.children[key] = child
+        return staged
+
+    def _resolve(self, path: tuple) -> object | None:
+        container: object = self._institute
+        for depth, key in enumerate(path):
+            staged = self._staged(container, path[:depth])
+            child = staged.children.get(key)
+            if child is None:
+                self._errors.append(f"{staged.label.format(key)} not found in {_describe(path[:depth])}.")
+                return None
+            container = child
+        return container
+
+    def _stage_add(self, path: tuple, child: object) -> None:
+        container = self._resolve(path)
+        if container is None:
+            return
+        staged = self._staged(container, path)
+        if not isinstance(child, staged.child_type):
+            self._errors.append(
+                f"Cannot add {type(child).__name__} to {_describe(path)}: expected {staged.child_type.__name__}."
+            )
+            return
+        key = staged.key(child)
+        if key in staged.children:
+            self._errors.append(f"{staged.label.format(key)} already exists in {_describe(path)}.")
+            return
+        staged.children[key] = child
+        staged.changed = True
+
+    def _stage_remove(self, path: tuple, key: Hashable) -> None:
+        container = self._resolve(path)
+        if container is None:
+            return
+        staged = self._staged(container, path)
+        if staged.children.pop(key, None) is None:
+            self._errors.append(f"{staged.label.format(key)} not found in {_describe(path)}.")
+            return
+        staged.changed = True
+
+    def _stage_rename(self, path: tuple, key: Hashable, new_name: str) -> None:
+        container = self._resolve(path)
+        if container is None:
+            return
+        staged = self._staged(container, path)
+        entity = staged.children.get(key)
+        if entity is None:
+            self._errors.append(f"{staged.label.format(key)} not found in {_describe(path)}.")
+            return
+        try:
+            new_key = UniversityEntity._validate_name(new_name)
+        except ValueError as exc:
+            self._errors.append(f"Cannot rename {staged.label.format(key)}: {exc}")
+            return
+        if new_key != key and new_key in staged.children:
+            self._errors.append(f"{staged.label.format(new_key)} already exists in {_describe(path)}.")
+            return
+        del staged.children[key]
+        staged.children[new_key] = entity
+        self._renames.append((entity, new_key))
+
+    def _stage_move(self, source: tuple, key: Hashable, target: tuple, expected: type) -> None:
+        source_container = self._resolve(source)
+        target_container = self._resolve(target)
+        if source_container is None or target_container is None:
+            return
+        source_staged = self._staged(source_container, source)
+        entity = source_staged.children.get(key)
+        if entity is None:
+            self._errors.append(f"{source_staged.label.format(key)} not found in {_describe(source)}.")
+            return
+        if not isinstance(entity, expected):
+            self._errors.append(
+                f"Cannot move {type(entity).__name__} {key} from {_describe(source)}: expected {expected.__name__}."
+            )
+            return
+        if source_container is target_container:
+            return
+        target_staged = self._staged(target_container, target)
+        if key in target_staged.children:
+            self._errors.append(f"{target_staged.label.format(key)} already exists in {_describe(target)}.")
+            return
+        del source_staged.children[key]
+        target_staged.children[key] = entity
+        source_staged.changed = target_staged.changed = True
+
+    def _stage_promote(self, number: int) -> None:
+        if number in self._promoted_into:
+            self._errors.append(
+                f"Cannot promote course {number}: it already received course {number - 1} in this transaction."
+            )
+            return
+        course = self._resolve((number,))
+        if course is None:
+            return
+        courses = self._staged(self._institute, ())
+        next_course = courses.children.get(number + 1)
+        if next_course is None:
+            try:
+                next_course = Course(name=f"Course {number + 1}", number=number + 1)
+            except ValueError as exc:
+                self._errors.append(f"Cannot promote course {number}: {exc}")
+                return
+            courses.children[next_course.number] = next_course
+            courses.changed = True
+        self._promoted_into.add(next_course.number)
+        self._merge((number,), course, (next_course.number,), next_course)
+
+    def _merge(self, source_path: tuple, source: object, target_path: tuple, target: object) -> None:
+        source_staged = self._staged(source, source_path)
+        target_staged = self._staged(target, target_path)
+        for key, child in source_staged.children.items():
+            existing = target_staged.children.get(key)
+            if existing is None:
+                target_staged.children[key] = child
+            elif isinstance(existing, (Faculty, Department)):
+                self._merge(source_path + (key,), child, target_path + (key,), existing)
+            else:
+                self._errors.append(
+                    f"{target_staged.label.format(key)} already exists in "
+                    f"{_describe(target_path)} of course {target_path[0]}."
+                )
+        source_staged.children.clear()
+        source_staged.changed = target_staged.changed = True
+
+    def _apply(self) -> None:
+        previous_names = [(entity, entity.name) for entity, _ in self._renames]
+        replaced: List[Tuple[_StagedChildren, List[object]]] = []
+        try:
+            for entity, new_name in self._renames:
+                entity.rename(new_name)
+            for staged in self._index.values():
+                if not staged.changed:
+                    continue
+                kept = {id(child) for child in staged.children.values()}
+                existing = {id(child) for child in staged.original}
+                updated = [child for child in staged.original if id(child) in kept]
+                updated.extend(child for child in staged.children.values() if id(child) not in existing)
+                replaced.append((staged, staged.replace(updated)))
+            if self._on_commit is not None:
+                self._on_commit(self._institute)
+        except BaseException:
+            for entity, old_name in reversed(previous_names):
+                entity.rename(old_name)
+            for staged, previous in reversed(replaced):
+                staged.replace(previous)
+            raise
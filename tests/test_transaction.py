@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import pytest
+
+from institute.course import Course
+from institute.department import Department
+from institute.faculty import Faculty
+from institute.group import Group
+from institute.institute import Institute
+from institute.student import Student
+
+
+def make_institute() -> Institute:
+    return Institute.from_dict(
+        {
+            "name": "Tech",
+            "courses": [
+                {
+                    "number": 1,
+                    "faculties": [
+                        {
+                            "name": "Cs",
+                            "departments": [
+                                {
+                                    "name": "Ai",
+                                    "groups": [
+                                        {
+                                            "name": "G1",
+                                            "students": [
+                                                {"first_name": "Ann", "last_name": "Lee", "student_id": "1"},
+                                                {"first_name": "Bob", "last_name": "Ray", "student_id": "2"},
+                                            ],
+                                        },
+                                        {"name": "G2"},
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def department_of(institute: Institute, number: int = 1) -> Department:
+    return institute.find_course(number).find_faculty("Cs").find_department("Ai")
+
+
+def test_commit_applies_batch_and_persists_once() -> None:
+    institute = make_institute()
+    saved = []
+    with institute.transaction(on_commit=saved.append) as transaction:
+        transaction.add_course(Course(name="Second", number=2))
+        transaction.add_faculty(2, Faculty(name="math"))
+        transaction.add_department((2, "math"), Department(name="algebra"))
+        transaction.add_group((2, "math", "algebra"), Group(name="a1"))
+        transaction.add_student((2, "math", "algebra", "a1"), Student("Cid", "Roe", "3"))
+        transaction.remove_student((1, "cs", "ai", "g1"), "2")
+
+    assert saved == [institute]
+    group = institute.find_course(2).find_faculty("Math").find_department("Algebra").find_group("A1")
+    assert [student.student_id for student in group.students] == ["3"]
+    assert [student.student_id for student in department_of(institute).find_group("G1").students] == ["1"]
+
+
+def test_conflicts_are_reported_together_and_nothing_is_applied() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+    transaction = institute.transaction()
+    transaction.add_group((1, "cs", "ai"), Group(name="g3"))
+    transaction.add_group((1, "cs", "ai"), Group(name="g2"))
+    transaction.remove_student((1, "cs", "ai", "g1"), "99")
+    transaction.add_faculty(4, Faculty(name="physics"))
+
+    with pytest.raises(ValueError) as excinfo:
+        transaction.commit()
+
+    message = str(excinfo.value)
+    assert "Group G2 already exists in department Ai." in message
+    assert "Student with ID 99 not found in group G1." in message
+    assert "Course number 4 not found in the institute." in message
+    assert institute.to_dict() == before
+
+
+def test_failed_on_commit_rolls_everything_back() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+
+    def fail(_: Institute) -> None:
+        raise OSError("disk full")
+
+    transaction = institute.transaction(on_commit=fail)
+    transaction.rename_group((1, "cs", "ai"), "g1", "g9")
+    transaction.add_group((1, "cs", "ai"), Group(name="g1"))
+    transaction.remove_student((1, "cs", "ai", "g9"), "1")
+    transaction.add_faculty(1, Faculty(name="math"))
+
+    with pytest.raises(OSError):
+        transaction.commit()
+
+    assert institute.to_dict() == before
+
+
+def test_rename_is_visible_to_later_operations() -> None:
+    institute = make_institute()
+    with institute.transaction() as transaction:
+        transaction.rename_group((1, "cs", "ai"), "g1", "g9")
+        transaction.add_student((1, "cs", "ai", "g9"), Student("Cid", "Roe", "3"))
+        transaction.add_group((1, "cs", "ai"), Group(name="g1"))
+
+    department = department_of(institute)
+    assert [group.name for group in department.groups] == ["G9", "G2", "G1"]
+    assert [student.student_id for student in department.find_group("G9").students] == ["1", "2", "3"]
+
+
+def test_duplicate_sibling_names_are_rejected_without_data_loss() -> None:
+    institute = make_institute()
+    department = department_of(institute)
+    department.groups[0].rename("G2")
+
+    with pytest.raises(ValueError, match="Group G2 appears more than once in department Ai."):
+        with institute.transaction() as transaction:
+            transaction.add_group((1, "cs", "ai"), Group(name="g3"))
+
+    assert len(department.groups) == 2
+
+
+def test_exception_inside_with_block_discards_queue() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+    with pytest.raises(RuntimeError):
+        with institute.transaction() as transaction:
+            transaction.remove_group((1, "cs", "ai"), "g2")
+            raise RuntimeError("abort")
+
+    assert institute.to_dict() == before
+
+
+def test_explicit_commit_inside_with_block_persists_once() -> None:
+    institute = make_institute()
+    saved = []
+    with institute.transaction(on_commit=saved.append) as transaction:
+        transaction.remove_group((1, "cs", "ai"), "g2")
+        transaction.commit()
+
+    assert len(saved) == 1
+
+
+def test_path_of_wrong_depth_is_rejected_when_queued() -> None:
+    transaction = make_institute().transaction()
+    with pytest.raises(TypeError, match="Expected a path of 2 parts"):
+        transaction.add_department((1,), Department(name="oops"))
+    with pytest.raises(TypeError, match="Expected a path of 4 parts"):
+        transaction.remove_student((1, "cs", "ai"), "1")
+    assert len(transaction) == 0
+
+
+def test_child_of_wrong_type_is_rejected() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+    with pytest.raises(ValueError, match="Cannot add Department to course 1: expected Faculty."):
+        with institute.transaction() as transaction:
+            transaction.add_faculty(1, Department(name="oops"))
+
+    assert institute.to_dict() == before
+
+
+def test_move_student_and_group_relink_existing_objects() -> None:
+    institute = make_institute()
+    department = department_of(institute)
+    student = department.find_group("G1").find_student("2")
+    group = department.find_group("G2")
+    with institute.transaction() as transaction:
+        transaction.add_course(Course(name="Second", number=2))
+        transaction.add_faculty(2, Faculty(name="cs"))
+        transaction.add_department((2, "cs"), Department(name="ai"))
+        transaction.move_student((1, "cs", "ai", "g1"), "2", (1, "cs", "ai", "g2"))
+        transaction.move_group((1, "cs", "ai"), "g2", (2, "cs", "ai"))
+
+    assert [group.name for group in department.groups] == ["G1"]
+    moved = department_of(institute, 2).find_group("G2")
+    assert moved is group
+    assert moved.students == (student,)
+
+
+def test_move_into_occupied_slot_is_rejected() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+    with pytest.raises(ValueError, match="Student with ID 1 already exists in group G1."):
+        with institute.transaction() as transaction:
+            transaction.add_student((1, "cs", "ai", "g2"), Student("Ann", "Kim", "1"))
+            transaction.move_student((1, "cs", "ai", "g2"), "1", (1, "cs", "ai", "g1"))
+
+    assert institute.to_dict() == before
+
+
+def test_promote_merges_faculties_and_departments_by_name() -> None:
+    institute = make_institute()
+    institute.add_course(
+        Course.from_dict({"number": 2, "faculties": [{"name": "Cs", "departments": [{"name": "Ai"}]}]})
+    )
+    course_one = institute.find_course(1)
+    group = department_of(institute).find_group("G1")
+
+    with institute.transaction() as transaction:
+        transaction.promote_course(1)
+
+    assert course_one.faculties == ()
+    faculties = institute.find_course(2).faculties
+    assert [faculty.name for faculty in faculties] == ["Cs"]
+    assert [group.name for group in department_of(institute, 2).groups] == ["G1", "G2"]
+    assert department_of(institute, 2).find_group("G1") is group
+
+
+def test_promote_creates_missing_next_course() -> None:
+    institute = make_institute()
+    with institute.transaction() as transaction:
+        transaction.promote_course(1)
+
+    assert institute.find_course(2).name == "Course 2"
+    assert [group.name for group in department_of(institute, 2).groups] == ["G1", "G2"]
+
+
+def test_promote_reports_every_group_conflict_and_changes_nothing() -> None:
+    institute = make_institute()
+    institute.add_course(
+        Course.from_dict(
+            {
+                "number": 2,
+                "faculties": [
+                    {"name": "Cs", "departments": [{"name": "Ai", "groups": [{"name": "G1"}, {"name": "G2"}]}]}
+                ],
+            }
+        )
+    )
+    before = institute.to_dict()
+
+    with pytest.raises(ValueError) as excinfo:
+        with institute.transaction() as transaction:
+            transaction.promote_course(1)
+            transaction.promote_course(6)
+
+    message = str(excinfo.value)
+    assert "Group G1 already exists in department Ai of course 2." in message
+    assert "Group G2 already exists in department Ai of course 2." in message
+    assert "Course number 6 not found in the institute." in message
+    assert institute.to_dict() == before
+
+
+def test_rollover_must_be_queued_from_the_highest_course() -> None:
+    institute = make_institute()
+    institute.add_course(Course.from_dict({"number": 2, "faculties": [{"name": "Math"}]}))
+    before = institute.to_dict()
+
+    with pytest.raises(ValueError, match="Cannot promote course 2: it already received course 1"):
+        with institute.transaction() as transaction:
+            transaction.promote_course(1)
+            transaction.promote_course(2)
+    assert institute.to_dict() == before
+
+    with institute.transaction() as transaction:
+        transaction.promote_course(2)
+        transaction.promote_course(1)
+    assert [faculty.name for faculty in institute.find_course(3).faculties] == ["Math"]
+    assert [faculty.name for faculty in institute.find_course(2).faculties] == ["Cs"]
+    assert institute.find_course(1).faculties == ()
+
+
+def test_promote_past_last_course_is_rejected() -> None:
+    institute = Institute.from_dict({"name": "Tech", "courses": [{"number": 6, "faculties": [{"name": "Cs"}]}]})
+    with pytest.raises(ValueError, match="Cannot promote course 6: Course number must be between 1 and 6."):
+        with institute.transaction() as transaction:
+            transaction.promote_course(6)
+
+
+def test_move_requires_paths_of_matching_depth() -> None:
+    transaction = make_institute().transaction()
+    with pytest.raises(TypeError, match="Expected a path of 3 parts"):
+        transaction.move_group((1, "cs", "ai", "g1"), "1", (1, "cs", "ai", "g2"))
+    with pytest.raises(TypeError, match="Expected a path of 4 parts"):
+        transaction.move_student((1, "cs", "ai"), "g1", (1, "cs", "ai"))
+    assert len(transaction) == 0
+
+
+def test_move_rejects_entity_of_unexpected_type() -> None:
+    institute = make_institute()
+    before = institute.to_dict()
+    transaction = institute.transaction()
+    transaction._queue(transaction._stage_move, (1, "Cs", "Ai", "G1"), "1", (1, "Cs", "Ai", "G2"), Group)
+
+    with pytest.raises(ValueError, match="Cannot move Student 1 from group G1: expected Group."):
+        transaction.commit()
+
+    assert institute.to_dict() == before